@@ -8,22 +8,93 @@ Currently validates:
 
 from __future__ import annotations
 
+import fnmatch
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, Optional
+
+# Below this many files the process pool costs more to start than it saves.
+PARALLEL_THRESHOLD = 8
+
+_GLOB_MAGIC = re.compile(r"[*?[]")
+# Path.glob matches names case-insensitively on Windows; keep that behaviour.
+_NAME_FLAGS = re.IGNORECASE if os.name == "nt" else 0
+
+_validator: Any = None
+_loader: Any = None
 
 
 def find_files(patterns: list[str]) -> list[Path]:
+    """Return files matching ``patterns``, scanning each directory once.
+
+    Patterns sharing a literal parent directory are folded into one compiled
+    regex and matched against a single ``os.scandir`` pass, whose entries
+    already carry the file-type bit. Patterns with wildcards in the directory
+    part fall back to ``Path.glob``.
+    """
+    by_dir: dict[str, list[str]] = {}
     files: list[Path] = []
     for pat in patterns:
-        files.extend(Path(".").glob(pat))
-    return [f for f in files if f.is_file()]
+        parent, _, name = pat.rpartition("/")
+        if _GLOB_MAGIC.search(parent):
+            files.extend(f for f in Path(".").glob(pat) if f.is_file())
+            continue
+        by_dir.setdefault(parent or ".", []).append(fnmatch.translate(name))
+
+    for directory, name_patterns in by_dir.items():
+        matcher = re.compile("|".join(name_patterns), _NAME_FLAGS)
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if matcher.match(entry.name) and entry.is_file():
+                        files.append(Path(directory) / entry.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+    return files
+
+
+def _init_validator(schema: dict) -> None:
+    """Compile the schema validator once per process.
+
+    The schema must already have passed ``check_schema`` in the parent.
+    """
+    global _validator, _loader
+    import jsonschema  # type: ignore
+    import yaml  # type: ignore
+
+    # Honour the schema's declared draft rather than jsonschema.validate()
+    # rebuilding a validator for every workflow file.
+    _validator = jsonschema.validators.validator_for(schema)(schema)
+    _loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
+def _validate_one(wf_path: Path) -> tuple[Path, list[str]]:
+    """Validate a single workflow file; an empty message list means OK."""
+    import yaml  # type: ignore
 
-def validate_workflows() -> int:
+    try:
+        data = yaml.load(wf_path.read_text(encoding="utf-8"), Loader=_loader)
+        # iter_errors is lazy, so resolution failures such as a dangling $ref
+        # surface here and are reported against this file only.
+        problems = sorted(_validator.iter_errors(data), key=lambda err: list(err.path))
+    except Exception as e:
+        return wf_path, [str(e)]
+
+    messages = []
+    for err in problems:
+        location = "/".join(str(p) for p in err.path) or "<root>"
+        messages.append(f"{location}: {err.message}")
+    return wf_path, messages
+
+
+def validate_workflows(max_workers: Optional[int] = None) -> int:
     try:
         import jsonschema  # type: ignore
-        import yaml  # type: ignore
+        import yaml  # type: ignore  # noqa: F401
     except Exception:
         print("jsonschema and PyYAML are required for schema validation", file=sys.stderr)
         return 2
@@ -34,16 +105,35 @@ def validate_workflows() -> int:
         return 0
 
     schema = json.loads(schema_path.read_text(encoding="utf-8"))
+    # Check once up front: a bad schema would otherwise raise in every worker
+    # initializer and surface as BrokenProcessPool.
+    try:
+        jsonschema.validators.validator_for(schema).check_schema(schema)
+    except jsonschema.exceptions.SchemaError as e:
+        print(f"FAIL {schema_path}: invalid schema: {e.message}", file=sys.stderr)
+        return 1
+
+    wf_paths = sorted(find_files([".ai/workflows/*.yaml", ".ai/workflows/*.yml"]))
+
+    if len(wf_paths) < PARALLEL_THRESHOLD:
+        _init_validator(schema)
+        results = [_validate_one(p) for p in wf_paths]
+    else:
+        workers = max_workers or min(os.cpu_count() or 1, len(wf_paths))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_validator, initargs=(schema,)
+        ) as ex:
+            results = list(ex.map(_validate_one, wf_paths))
+
+    # Report after the join so output order is stable across runs.
     errors = 0
-
-    for wf_path in find_files([".ai/workflows/*.yaml", ".ai/workflows/*.yml"]):
-        try:
-            data = yaml.safe_load(wf_path.read_text(encoding="utf-8"))
-            jsonschema.validate(data, schema)
+    for wf_path, messages in results:
+        if not messages:
             print(f"OK {wf_path}")
-        except Exception as e:
-            errors += 1
-            print(f"FAIL {wf_path}: {e}", file=sys.stderr)
+            continue
+        errors += 1
+        for message in messages:
+            print(f"FAIL {wf_path}: {message}", file=sys.stderr)
 
     return errors
 
@@ -56,4 +146,3 @@ def main() -> int:
 
 if __name__ == "__main__":
     sys.exit(main())
-
@@ -63,7 +63,7 @@ def run_gdw(
 
     if spec_path.exists():
         try:
-            result["spec"] = json.loads(spec_path.read_text())
+            result["spec"] = json.loads(spec_path.read_bytes())
         except json.JSONDecodeError as exc:
             raise GDWRunnerError(f"Invalid GDW specification: {exc}") from exc
     else:
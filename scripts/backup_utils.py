@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
 import shutil
+import sqlite3
+from contextlib import closing
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -9,7 +12,52 @@ def _ensure_dir(p: Path) -> None:
     p.mkdir(parents=True, exist_ok=True)
 
 
-def backup_database(database_url: str, dest_dir: str) -> Path:
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy ``src`` to ``dst`` like ``copy2``, keeping the bytes in-kernel."""
+    if not hasattr(os, "copy_file_range"):
+        # copy2 already uses sendfile/fcopyfile on the platforms that have them
+        shutil.copy2(src, dst)
+        return
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fin.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            while os.copy_file_range(fin.fileno(), fout.fileno(), 1 << 30):
+                pass
+        except OSError:
+            # e.g. EXDEV on older kernels or filesystems without support
+            fin.seek(0)
+            fout.seek(0)
+            fout.truncate()
+            shutil.copyfileobj(fin, fout, 4 * 1024 * 1024)
+    shutil.copystat(src, dst)
+
+
+def _backup_is_current(db_path: Path, out: Path) -> bool:
+    """True if ``out`` was written after the last change to ``db_path``."""
+    try:
+        out_st = out.stat()
+    except FileNotFoundError:
+        return False
+    src_st = db_path.stat()
+    if out_st.st_size != src_st.st_size:
+        return False
+    newest = src_st.st_mtime_ns
+    # In WAL mode writes land in the -wal file until a checkpoint
+    wal = db_path.with_name(db_path.name + "-wal")
+    try:
+        newest = max(newest, wal.stat().st_mtime_ns)
+    except FileNotFoundError:
+        pass
+    return out_st.st_mtime_ns > newest
+
+
+def backup_database(database_url: str, dest_dir: str, force: bool = False) -> Path:
+    """Back up a SQLite database into ``dest_dir``.
+
+    An existing backup that is newer than the database (and its WAL) and the
+    same size is returned as-is; pass ``force=True`` to always take a fresh copy.
+    """
     parsed = urlparse(database_url)
     dest = Path(dest_dir)
     _ensure_dir(dest)
@@ -20,7 +68,13 @@ def backup_database(database_url: str, dest_dir: str) -> Path:
         if not db_path.exists():
             raise FileNotFoundError(f"SQLite DB not found: {db_path}")
         out = dest / f"sqlite-backup-{db_path.stem}.db"
-        shutil.copy2(db_path, out)
+        if not force and _backup_is_current(db_path, out):
+            return out
+        # The online backup API takes a consistent snapshot even while other
+        # connections are writing, unlike a raw copy of the db/journal files.
+        with closing(sqlite3.connect(db_path)) as src:
+            with closing(sqlite3.connect(out)) as dst:
+                src.backup(dst, pages=1024)
         return out
     raise NotImplementedError("Only SQLite backup is implemented in utils; use pg_dump for Postgres")
 
@@ -32,7 +86,7 @@ def restore_database(database_url: str, backup_file: str) -> None:
         if db_path.drive == "":
             db_path = Path(".") / db_path.relative_to("/")
         src = Path(backup_file)
-        shutil.copy2(src, db_path)
+        _copy_file(src, db_path)
         return
     raise NotImplementedError("Only SQLite restore is implemented in utils; use psql/pg_restore for Postgres")
 
@@ -1,32 +1,102 @@
 import ast
+import json
 import os
 
+CACHE_FILE = os.path.join(".cache", "doc_coverage.json")
 
-def check_doc_coverage(directory="src"):
+_DEF_NODES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+# Statement-list fields; definitions can't appear inside expressions, so these
+# are the only places worth descending into.
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_definitions(tree):
+    """Yield function/class definitions, visiting statement blocks only."""
+    stack = list(tree.body)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _DEF_NODES):
+            yield node
+        for field in _BLOCK_FIELDS:
+            block = getattr(node, field, None)
+            if isinstance(block, list):
+                stack.extend(block)
+
+
+def _count_docstrings(file_path):
+    """Return (total_nodes, nodes_with_docstrings) for one file, module included."""
+    with open(file_path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=os.path.basename(file_path))
+    total = 1
+    documented = 1 if ast.get_docstring(tree) else 0
+    for node in _iter_definitions(tree):
+        total += 1
+        if ast.get_docstring(node):
+            documented += 1
+    return total, documented
+
+
+def _load_cache(cache_file):
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file, cache):
+    try:
+        os.makedirs(os.path.dirname(cache_file) or ".", exist_ok=True)
+        tmp = f"{cache_file}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, cache_file)
+    except OSError as e:
+        print(f"Could not write coverage cache {cache_file}: {e}")
+
+
+def check_doc_coverage(directory="src", cache_file=CACHE_FILE):
     """
     Analyzes Python files in a directory to check for docstring coverage.
     Reports coverage for modules, classes, and functions.
+
+    Per-file counts are cached in ``cache_file`` keyed on (mtime_ns, size),
+    so only files changed since the previous run are re-parsed. Pass
+    ``cache_file=None`` to disable the cache.
     """
     total_nodes = 0
     nodes_with_docstrings = 0
+    cache = _load_cache(cache_file) if cache_file else {}
+    fresh_cache = {}
 
     for root, _, files in os.walk(directory):
         for file in files:
             if file.endswith(".py"):
-                total_nodes += 1  # Count module
                 file_path = os.path.join(root, file)
-                with open(file_path, encoding="utf-8") as f:
+                st = os.stat(file_path)
+                entry = cache.get(file_path)
+                key = [st.st_mtime_ns, st.st_size]
+                if entry and [entry["mtime_ns"], entry["size"]] == key:
+                    total, documented = entry["total"], entry["documented"]
+                else:
                     try:
-                        tree = ast.parse(f.read(), filename=file)
-                        if ast.get_docstring(tree):
-                            nodes_with_docstrings += 1
-                        for node in ast.walk(tree):
-                            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                                total_nodes += 1
-                                if ast.get_docstring(node):
-                                    nodes_with_docstrings += 1
+                        total, documented = _count_docstrings(file_path)
                     except SyntaxError as e:
+                        total_nodes += 1  # Count module
                         print(f"Error parsing {file_path}: {e}")
+                        continue
+                    entry = {
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "total": total,
+                        "documented": documented,
+                    }
+                fresh_cache[file_path] = entry
+                total_nodes += total
+                nodes_with_docstrings += documented
+
+    if cache_file and fresh_cache != cache:
+        _save_cache(cache_file, fresh_cache)
 
     if total_nodes == 0:
         print("No Python files found to analyze.")
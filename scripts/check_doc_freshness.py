@@ -3,15 +3,28 @@ import subprocess
 import sys
 
 
-def get_last_commit_date(file_path):
-    """Gets the last commit date of a file using git."""
+def get_last_commit_dates(*paths):
+    """Maps every file under ``paths`` to its last commit date with one git call."""
+    cmd = [
+        "git", "-c", "core.quotePath=false", "log", "--relative",
+        "--format=COMMIT:%ct", "--name-only", "--", *paths,
+    ]
     try:
-        cmd = ["git", "log", "-1", "--format=%ct", file_path]
-        result = subprocess.check_output(cmd).strip()
-        return int(result)
+        output = subprocess.check_output(cmd, text=True, encoding="utf-8")
     except (subprocess.CalledProcessError, FileNotFoundError):
-        # Return a very old timestamp if file not in git or git not found
-        return 0
+        return {}
+
+    dates = {}
+    timestamp = 0
+    for line in output.splitlines():
+        if line.startswith("COMMIT:"):
+            timestamp = int(line[len("COMMIT:"):])
+        elif line:
+            path = os.path.normpath(line)
+            # Commit order isn't strictly chronological; keep the newest date
+            if timestamp > dates.get(path, 0):
+                dates[path] = timestamp
+    return dates
 
 def check_doc_freshness(source_dir="src", docs_dir="docs"):
     """
@@ -20,6 +33,7 @@ def check_doc_freshness(source_dir="src", docs_dir="docs"):
     """
     stale_files = []
     print(f"Checking for stale documentation in '{docs_dir}' relative to '{source_dir}'...")
+    commit_dates = get_last_commit_dates(source_dir, docs_dir)
 
     for root, _, files in os.walk(source_dir):
         for file in files:
@@ -32,8 +46,8 @@ def check_doc_freshness(source_dir="src", docs_dir="docs"):
             doc_file_path = os.path.join(docs_dir, doc_file_name)
 
             if os.path.exists(doc_file_path):
-                source_date = get_last_commit_date(source_file_path)
-                doc_date = get_last_commit_date(doc_file_path)
+                source_date = commit_dates.get(os.path.normpath(source_file_path), 0)
+                doc_date = commit_dates.get(os.path.normpath(doc_file_path), 0)
 
                 # If source is newer than docs, it's stale
                 if source_date > doc_date:
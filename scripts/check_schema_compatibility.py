@@ -1,23 +1,58 @@
 from __future__ import annotations
 
+import codecs
 import json
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - optional speedup
+    _loads = json.loads
+
+
+def _parse_json(data: bytes) -> Any:
+    # Several schemas are saved with a UTF-8 BOM, which orjson rejects
+    if data.startswith(codecs.BOM_UTF8):
+        data = data[len(codecs.BOM_UTF8) :]
+    return _loads(data)
+
 
 def _load_json(p: Path) -> dict[str, Any]:
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return _parse_json(p.read_bytes())
 
 
-def _git_show(path: str, ref: str) -> dict[str, Any] | None:
+def _git_show_many(paths: list[str], ref: str) -> dict[str, dict[str, Any] | None]:
+    """Read ``ref:path`` for every path through a single ``git cat-file --batch``."""
+    if not paths:
+        return {}
+    request = "".join(f"{ref}:{p}\n" for p in paths).encode("utf-8")
     try:
-        out = subprocess.check_output(["git", "show", f"{ref}:{path}"])  # nosec B603
-    except subprocess.CalledProcessError:
-        return None
-    return json.loads(out.decode("utf-8"))
+        proc = subprocess.run(  # nosec B603
+            ["git", "cat-file", "--batch"], input=request, capture_output=True, check=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return dict.fromkeys(paths)
+
+    out = proc.stdout
+    results: dict[str, dict[str, Any] | None] = {}
+    pos = 0
+    for p in paths:
+        eol = out.index(b"\n", pos)
+        header = out[pos:eol].split()
+        pos = eol + 1
+        if len(header) != 3 or header[1] != b"blob":
+            # "<name> missing" / "ambiguous"; nothing further to skip
+            results[p] = None
+            continue
+        size = int(header[2])
+        results[p] = _parse_json(out[pos : pos + size])
+        pos += size + 1  # contents are followed by a newline
+    return results
 
 
 def compare_schemas(base: dict[str, Any], curr: dict[str, Any]) -> tuple[bool, list[str]]:
@@ -53,14 +88,19 @@ def main(argv: list[str]) -> int:
     base_ref = "origin/main"
     root = Path(__file__).resolve().parents[1]
     schemas_dir = root / ".ai" / "schemas"
-    changed = []
+    changed: set[str] = set()
     try:
-        diff = subprocess.check_output(["git", "diff", "--name-only", f"{base_ref}...HEAD"])  # nosec B603
-        changed = [l.strip() for l in diff.decode("utf-8").splitlines() if l.strip().endswith(".json")]
+        # Let git apply the .json pathspec and skip deletions; -z output needs
+        # no unquoting. Paths are forward-slash and relative to the repo root.
+        diff = subprocess.check_output(  # nosec B603
+            ["git", "diff", "--name-only", "-z", "--diff-filter=d", f"{base_ref}...HEAD", "--", "*.json"]
+        )
+        changed = {name.decode("utf-8") for name in diff.split(b"\0") if name}
     except Exception:
         pass
 
     failures: list[str] = []
+    to_compare: list[tuple[Path, str, dict[str, Any]]] = []
     for path in schemas_dir.glob("*.json"):
         schema = _load_json(path)
         header_errs = ensure_schema_headers(schema)
@@ -68,14 +108,19 @@ def main(argv: list[str]) -> int:
             failures.append(f"{path}: {'; '.join(header_errs)}")
             continue
 
-        rel = str(path).replace(str(root) + "\\", "").replace(str(root) + "/", "")
+        rel = path.relative_to(root).as_posix()
         if not changed or rel in changed:
-            base = _git_show(rel, base_ref)
-            if base is None:
-                continue
-            compatible, reasons = compare_schemas(base, schema)
-            if not compatible and schema.get("version") == base.get("version"):
-                failures.append(f"{path}: breaking change without version bump: {', '.join(reasons)}")
+            to_compare.append((path, rel, schema))
+
+    # One git process for all base versions instead of a `git show` per schema
+    base_schemas = _git_show_many([rel for _, rel, _ in to_compare], base_ref)
+    for path, rel, schema in to_compare:
+        base = base_schemas.get(rel)
+        if base is None:
+            continue
+        compatible, reasons = compare_schemas(base, schema)
+        if not compatible and schema.get("version") == base.get("version"):
+            failures.append(f"{path}: breaking change without version bump: {', '.join(reasons)}")
 
     if failures:
         for f in failures:
@@ -1,28 +1,53 @@
 from __future__ import annotations
 
 import argparse
+import os
 import subprocess
 import time
 from pathlib import Path
 
+# Keep each `git branch -D` argv comfortably under command-line length limits
+BRANCH_DELETE_BATCH = 100
+
 
 def list_stale_branches(days: int) -> list[str]:
     cutoff = time.time() - days * 86400
-    out = subprocess.check_output(["git", "for-each-ref", "--format=%(refname:short)|%(committerdate:unix)", "refs/heads/"])  # nosec B603
+    # Oldest first, so parsing can stop at the first branch inside the window
+    out = subprocess.check_output(  # nosec B603
+        [
+            "git",
+            "for-each-ref",
+            "--sort=committerdate",
+            "--format=%(committerdate:unix) %(refname:short)",
+            "refs/heads/",
+        ]
+    )
     stale = []
-    for line in out.decode().splitlines():
-        name, ts = line.split("|")
-        if float(ts) < cutoff and name not in {"main", "master"}:
-            stale.append(name)
+    for line in out.splitlines():
+        ts, _, name = line.partition(b" ")
+        if float(ts) >= cutoff:
+            break
+        branch = name.decode()
+        if branch not in {"main", "master"}:
+            stale.append(branch)
     return stale
 
 
 def list_abandoned_locks(hours: int, base_dir: str = ".locks") -> list[Path]:
     cutoff = time.time() - hours * 3600
-    p = Path(base_dir)
-    if not p.exists():
+    try:
+        it = os.scandir(base_dir)
+    except FileNotFoundError:
         return []
-    return [f for f in p.glob("*.lock") if f.stat().st_mtime < cutoff]
+    # DirEntry caches the readdir type bits, so only lock files get a stat()
+    with it:
+        return [
+            Path(e.path)
+            for e in it
+            if e.name.endswith(".lock")
+            and e.is_file(follow_symlinks=False)
+            and e.stat(follow_symlinks=False).st_mtime < cutoff
+        ]
 
 
 def main() -> int:
@@ -37,8 +62,11 @@ def main() -> int:
 
     for b in stale:
         print(f"Stale branch: {b}")
-        if not args.dry_run:
-            subprocess.check_call(["git", "branch", "-D", b])  # nosec B603
+    if not args.dry_run:
+        # git accepts many refs per call; one process per batch, not per branch
+        for i in range(0, len(stale), BRANCH_DELETE_BATCH):
+            batch = stale[i : i + BRANCH_DELETE_BATCH]
+            subprocess.check_call(["git", "branch", "-D", *batch])  # nosec B603
 
     for lf in locks:
         print(f"Abandoned lock: {lf}")
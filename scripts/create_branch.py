@@ -7,14 +7,18 @@ import re
 import subprocess
 import sys
 
+_NON_WORD = re.compile(r'[^\w\s-]')
+_SEPARATORS = re.compile(r'[-\s]+')
+_TICKET_ID = re.compile(r'^[A-Z]+-\d+$', re.IGNORECASE)
+
 
 def normalize_name(text: str) -> str:
     """Normalize text for branch name."""
     # Convert to lowercase
     text = text.lower()
     # Replace spaces and special chars with hyphens
-    text = re.sub(r'[^\w\s-]', '', text)
-    text = re.sub(r'[-\s]+', '-', text)
+    text = _NON_WORD.sub('', text)
+    text = _SEPARATORS.sub('-', text)
     # Remove leading/trailing hyphens
     return text.strip('-')
 
@@ -31,7 +35,7 @@ def create_branch(ticket_id: str, description: str, branch_type: str = "feature"
         Branch name created
     """
     # Validate ticket ID format
-    if not re.match(r'^[A-Z]+-\d+$', ticket_id, re.IGNORECASE):
+    if not _TICKET_ID.match(ticket_id):
         print(f"Warning: Ticket ID '{ticket_id}' doesn't match standard format (e.g., PROJ-123)")
 
     # Normalize description
@@ -5,24 +5,172 @@ Finds duplicate files by content hash and similar AI config files.
 Compares files in user home directory vs CLI_RESTART project.
 """
 
+import argparse
 import hashlib
 import json
+import mmap
 import os
 import re
+import sqlite3
 from collections import defaultdict
+from contextlib import closing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # optional speedup
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:  # optional: fall back to pairwise comparison
+    MinHash = MinHashLSH = None
+
+# Duplicate detection only needs content equality, not a cryptographic hash,
+# so prefer the fastest available 128+ bit hash and fall back to SHA-256.
+try:
+    import xxhash
+
+    HASH_ALGORITHM, _new_hasher = "xxh3_128", xxhash.xxh3_128
+except ImportError:
+    try:
+        import blake3
+
+        HASH_ALGORITHM, _new_hasher = "blake3", blake3.blake3
+    except ImportError:
+        HASH_ALGORITHM, _new_hasher = "sha256", hashlib.sha256
+
+HASH_BLOCK_SIZE = 1024 * 1024
+HASH_CACHE_FILE = Path.home() / ".cache" / "duplicate_finder" / "hashes.sqlite"
+FINGERPRINT_BLOCK = 4096
+# The scan skips files larger than this
+MAX_FILE_SIZE = 10 * 1024 * 1024
+# Files above this size are hashed straight from a read-only mapping; kept
+# below MAX_FILE_SIZE so the largest scanned files take this path
+MMAP_THRESHOLD = MAX_FILE_SIZE // 2
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Config groups smaller than this are compared pairwise; MinHash is not worth it
+LSH_MIN_GROUP = 20
+LSH_NUM_PERM = 128
+
+_COMMENT_RE = re.compile(r'#.*')
+
+
+def _read_at(fd: int, length: int, offset: int) -> bytes:
+    """Read ``length`` bytes at ``offset``; os.pread is not available on Windows."""
+    if hasattr(os, "pread"):
+        return os.pread(fd, length, offset)
+    os.lseek(fd, offset, os.SEEK_SET)
+    return os.read(fd, length)
+
+
+def _mmap_digest(f) -> str:
+    """Hash an open file through mmap; return "" if it cannot be mapped."""
+    try:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            hasher = _new_hasher()
+            hasher.update(mm)
+            return hasher.hexdigest()
+    except (OSError, ValueError):
+        return ""
+
+
+def _scandir_recursive(
+    path: Path, skip_dirs: Set[str] = frozenset()
+) -> Iterator[os.DirEntry]:
+    """Yield file entries below ``path`` without descending into ``skip_dirs``.
+
+    ``skip_dirs`` holds lowercased directory names; matching is
+    case-insensitive.
+
+    ``os.DirEntry`` keeps the type information from the directory read, so
+    ``is_dir``/``is_file`` need no extra ``stat()`` call.
+    """
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name.lower() not in skip_dirs:
+                                stack.append(entry.path)
+                        elif entry.is_file():
+                            yield entry
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def _load_hash_cache(cache_file: Path) -> Dict[str, Tuple[int, int, str]]:
+    """Load ``path -> (size, mtime_ns, digest)`` from the SQLite hash cache.
+
+    Entries written with a different ``HASH_ALGORITHM`` are ignored.
+    """
+    if not cache_file.exists():
+        return {}
+    try:
+        with closing(sqlite3.connect(cache_file)) as conn:
+            rows = conn.execute(
+                "SELECT path, size, mtime_ns, digest FROM hashes WHERE algorithm = ?",
+                (HASH_ALGORITHM,),
+            )
+            return {path: (size, mtime, digest) for path, size, mtime, digest in rows}
+    except sqlite3.Error:
+        return {}
+
+
+def _save_hash_cache(cache_file: Path, entries: Dict[str, Tuple[int, int, str]]):
+    """Rewrite the SQLite hash cache with ``entries``."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(cache_file)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        with conn:
+            conn.execute("DROP TABLE IF EXISTS hashes")
+            conn.execute(
+                "CREATE TABLE hashes (path TEXT PRIMARY KEY, size INTEGER, "
+                "mtime_ns INTEGER, algorithm TEXT, digest TEXT)"
+            )
+            conn.executemany(
+                "INSERT INTO hashes VALUES (?, ?, ?, ?, ?)",
+                (
+                    (path, size, mtime_ns, HASH_ALGORITHM, digest)
+                    for path, (size, mtime_ns, digest) in entries.items()
+                ),
+            )
+
 
 class DuplicateFinder:
     """Find duplicate and similar files across directories."""
 
-    def __init__(self, home_dir: Path, project_dir: Path):
+    def __init__(
+        self, home_dir: Path, project_dir: Path, cache_file: Optional[Path] = None
+    ):
         self.home_dir = home_dir
         self.project_dir = project_dir
+        # Hashes from earlier runs; trusted while size and mtime are unchanged
+        self.cache_file = cache_file
+        self.hash_cache: Dict[str, Tuple[int, int, str]] = (
+            _load_hash_cache(cache_file) if cache_file else {}
+        )
+        # Entries hashed or revalidated this run; only these are persisted, so
+        # deleted and moved files drop out of the cache.
+        self.current_hashes: Dict[str, Tuple[int, int, str]] = {}
+        self.file_sizes: Dict[int, List[Path]] = defaultdict(list)
         self.file_hashes: Dict[str, List[Path]] = defaultdict(list)
+        self.hash_sizes: Dict[str, int] = {}
         self.ai_configs: Dict[str, List[Path]] = defaultdict(list)
         self.similar_configs: List[Tuple[Path, Path, float]] = []
 
@@ -37,15 +185,19 @@ class DuplicateFinder:
             r"ollama.*config.*",
             r"deepseek.*config.*",
         ]
+        self._ai_config_re = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.ai_config_patterns),
+            re.IGNORECASE,
+        )
 
-        # Directories to skip
-        self.skip_dirs = {
+        # Directories to skip (lowercased; pruned during traversal)
+        self.skip_dirs = frozenset(name.lower() for name in (
             ".git", ".venv", "venv", "node_modules", "__pycache__",
             ".pytest_cache", ".mypy_cache", ".ruff_cache",
             "artifacts", "logs", "cost", ".cache", ".local",
             "Downloads", "Documents", "Desktop", "Pictures", "Music",
             "Videos", "Saved Games", "scoop", "AppData"
-        }
+        ))
 
         # File extensions to skip
         self.skip_extensions = {
@@ -56,34 +208,93 @@ class DuplicateFinder:
 
     def is_ai_config_file(self, filepath: Path) -> bool:
         """Check if file matches AI config patterns."""
-        filename = filepath.name
-        return any(re.match(pattern, filename, re.IGNORECASE) for pattern in self.ai_config_patterns)
+        return self._ai_config_re.match(filepath.name) is not None
 
-    def should_skip(self, path: Path) -> bool:
-        """Check if path should be skipped."""
-        # Skip by directory name
-        if any(skip in path.parts for skip in self.skip_dirs):
-            return True
+    def should_skip(self, path: Path, size: Optional[int] = None) -> bool:
+        """Check if path should be skipped.
 
-        # Skip by extension
+        ``size`` may be passed when the caller already has the file size, to
+        avoid another ``stat()``.
+        """
+        # Skip by extension (skip_dirs are pruned by _scandir_recursive)
         if path.suffix.lower() in self.skip_extensions:
             return True
 
-        # Skip files larger than 10MB
+        # Skip files larger than MAX_FILE_SIZE (10MB)
+        if size is not None:
+            return size > MAX_FILE_SIZE
         try:
-            if path.is_file() and path.stat().st_size > 10 * 1024 * 1024:
+            if path.is_file() and path.stat().st_size > MAX_FILE_SIZE:
                 return True
         except (OSError, PermissionError):
             return True
 
         return False
 
+    def get_file_fingerprint(self, filepath: Path, size: int) -> bytes:
+        """Cheap BLAKE2b fingerprint of the first and last 4 KiB plus the size.
+
+        Not a content hash: equal fingerprints only make files candidates for
+        a full ``get_file_hash`` comparison.
+        """
+        try:
+            fd = os.open(filepath, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError:
+            return b""
+        try:
+            head = _read_at(fd, FINGERPRINT_BLOCK, 0)
+            tail = b""
+            if size > FINGERPRINT_BLOCK:
+                tail_offset = max(FINGERPRINT_BLOCK, size - FINGERPRINT_BLOCK)
+                tail = _read_at(fd, FINGERPRINT_BLOCK, tail_offset)
+        except OSError:
+            return b""
+        finally:
+            os.close(fd)
+        return hashlib.blake2b(
+            head + tail + size.to_bytes(8, 'little'), digest_size=16
+        ).digest()
+
     def get_file_hash(self, filepath: Path) -> str:
-        """Calculate SHA256 hash of file."""
+        """Calculate the content hash of a file, reusing the cached hash if unchanged.
+
+        Uses ``HASH_ALGORITHM``: xxh3_128 or BLAKE3 when installed, else SHA-256.
+        """
+        if self.cache_file is None:
+            return self._compute_file_hash(filepath)
+
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return ""
+        key = str(filepath)
+        cached = self.hash_cache.get(key)
+        if cached and cached[:2] == (st.st_size, st.st_mtime_ns):
+            self.current_hashes[key] = cached
+            return cached[2]
+
+        digest = self._compute_file_hash(filepath)
+        if digest:
+            self.current_hashes[key] = (st.st_size, st.st_mtime_ns, digest)
+        return digest
+
+    def save_hash_cache(self):
+        """Persist the hashes used in this run for the next one."""
+        if self.cache_file is not None:
+            _save_hash_cache(self.cache_file, self.current_hashes)
+
+    def _compute_file_hash(self, filepath: Path) -> str:
         try:
-            hasher = hashlib.sha256()
             with open(filepath, 'rb') as f:
-                while chunk := f.read(8192):
+                if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                    digest = _mmap_digest(f)
+                    if digest:
+                        return digest
+                if hasattr(hashlib, "file_digest"):
+                    return hashlib.file_digest(f, _new_hasher).hexdigest()
+                # Python < 3.11: large blocks amortize the per-read overhead
+                hasher = _new_hasher()
+                while chunk := f.read(HASH_BLOCK_SIZE):
                     hasher.update(chunk)
             return hasher.hexdigest()
         except (OSError, PermissionError):
@@ -91,59 +302,90 @@ class DuplicateFinder:
 
     def normalize_config_content(self, content: str) -> str:
         """Normalize config content for comparison (remove comments, whitespace)."""
-        # Remove comments
-        lines = []
-        for line in content.split('\n'):
-            # Remove YAML/Python comments
-            line = re.sub(r'#.*$', '', line)
-            # Remove trailing whitespace
-            line = line.rstrip()
-            if line:
-                lines.append(line)
-        return '\n'.join(lines)
-
-    def calculate_similarity(self, content1: str, content2: str) -> float:
-        """Calculate similarity ratio between two config files (0.0 to 1.0)."""
-        norm1 = self.normalize_config_content(content1)
-        norm2 = self.normalize_config_content(content2)
-
-        if not norm1 or not norm2:
+        # Remove YAML/Python comments in one pass, then trailing whitespace
+        content = _COMMENT_RE.sub('', content)
+        return '\n'.join(line.rstrip() for line in content.splitlines() if line.strip())
+
+    def load_config_lines(self, filepath: Path) -> Set[str]:
+        """Read a config file and return its set of normalized lines."""
+        with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+            normalized = self.normalize_config_content(f.read())
+        return set(normalized.split('\n')) if normalized else set()
+
+    def calculate_similarity(self, lines1: Set[str], lines2: Set[str]) -> float:
+        """Calculate similarity ratio between two config line-sets (0.0 to 1.0)."""
+        if not lines1 or not lines2:
             return 0.0
 
         # Simple line-based similarity
-        lines1 = set(norm1.split('\n'))
-        lines2 = set(norm2.split('\n'))
-
         intersection = len(lines1 & lines2)
         union = len(lines1 | lines2)
 
         return intersection / union if union > 0 else 0.0
 
     def scan_directory(self, root_dir: Path, is_project: bool = False):
-        """Scan directory and collect file hashes."""
+        """Scan directory and group files by size.
+
+        Hashing is deferred to ``_hash_size_collisions`` so that files with a
+        unique size, which cannot have duplicates, are never read.
+        """
         print(f"Scanning {'project' if is_project else 'home'}: {root_dir}")
 
-        for item in root_dir.rglob('*'):
-            if self.should_skip(item):
+        for entry in _scandir_recursive(root_dir, self.skip_dirs):
+            item = Path(entry.path)
+            try:
+                size = entry.stat().st_size
+            except (OSError, PermissionError):
+                print(f"  Skipped (permission denied): {item}")
                 continue
 
-            if not item.is_file():
+            if self.should_skip(item, size):
                 continue
 
-            try:
-                # Check if AI config file
-                if self.is_ai_config_file(item):
-                    key = item.name.lower()
-                    self.ai_configs[key].append(item)
+            # Check if AI config file
+            if self.is_ai_config_file(item):
+                key = item.name.lower()
+                self.ai_configs[key].append(item)
 
-                # Calculate hash for all files
-                file_hash = self.get_file_hash(item)
-                if file_hash:
-                    self.file_hashes[file_hash].append(item)
+            self.file_sizes[size].append(item)
 
-            except (OSError, PermissionError) as e:
-                print(f"  Skipped (permission denied): {item}")
-                continue
+    def _hash_size_collisions(self):
+        """Hash only the files whose size matches at least one other file.
+
+        Same-size files are first grouped by a cheap head+tail fingerprint, and
+        only fingerprint collisions get a full content hash. Hashing is I/O bound
+        and hashlib releases the GIL, so both stages run on a thread pool;
+        ``map`` keeps results in scan order.
+        """
+        same_size = [
+            (path, size)
+            for size, paths in self.file_sizes.items()
+            if len(paths) > 1
+            for path in paths
+        ]
+        if not same_size:
+            return
+
+        with ThreadPoolExecutor(max_workers=HASH_WORKERS) as pool:
+            fingerprints = pool.map(
+                lambda candidate: self.get_file_fingerprint(*candidate), same_size
+            )
+            groups: Dict[Tuple[int, bytes], List[Path]] = defaultdict(list)
+            for (path, size), fingerprint in zip(same_size, fingerprints):
+                if fingerprint:
+                    groups[(size, fingerprint)].append(path)
+
+            candidates = [
+                (path, size)
+                for (size, _), paths in groups.items()
+                if len(paths) > 1
+                for path in paths
+            ]
+            hashes = pool.map(self.get_file_hash, [path for path, _ in candidates])
+            for (path, size), file_hash in zip(candidates, hashes):
+                if file_hash:
+                    self.file_hashes[file_hash].append(path)
+                    self.hash_sizes[file_hash] = size
 
     def find_exact_duplicates(self) -> Dict[str, List[Path]]:
         """Find files with identical content."""
@@ -161,35 +403,73 @@ class DuplicateFinder:
             if len(paths) < 2:
                 continue
 
-            # Compare all pairs
-            for i, path1 in enumerate(paths):
-                for path2 in paths[i+1:]:
-                    try:
-                        with open(path1, 'r', encoding='utf-8', errors='ignore') as f1:
-                            content1 = f1.read()
-                        with open(path2, 'r', encoding='utf-8', errors='ignore') as f2:
-                            content2 = f2.read()
+            if MinHashLSH is not None and len(paths) >= LSH_MIN_GROUP:
+                self._find_similar_with_lsh(paths, threshold)
+                continue
 
-                        similarity = self.calculate_similarity(content1, content2)
+            # Read each file once, then compare all pairs
+            line_sets: Dict[Path, Set[str]] = {}
+            for path in paths:
+                try:
+                    line_sets[path] = self.load_config_lines(path)
+                except OSError:
+                    continue
+
+            readable = [path for path in paths if path in line_sets]
+            for i, path1 in enumerate(readable):
+                for path2 in readable[i+1:]:
+                    similarity = self.calculate_similarity(
+                        line_sets[path1], line_sets[path2]
+                    )
+                    if similarity >= threshold:
+                        self.similar_configs.append((path1, path2, similarity))
+
+    def _find_similar_with_lsh(self, paths: List[Path], threshold: float):
+        """Find similar configs via MinHash/LSH instead of comparing every pair.
+
+        LSH only proposes candidate pairs; each one is confirmed with the exact
+        line-set Jaccard similarity used by ``calculate_similarity``.
+        """
+        line_sets: Dict[int, Set[str]] = {}
+        lsh = MinHashLSH(threshold=threshold, num_perm=LSH_NUM_PERM)
+        for index, path in enumerate(paths):
+            try:
+                lines = self.load_config_lines(path)
+            except OSError:
+                continue
+            if not lines:
+                continue
 
-                        if similarity >= threshold:
-                            self.similar_configs.append((path1, path2, similarity))
+            signature = MinHash(num_perm=LSH_NUM_PERM)
+            for line in lines:
+                signature.update(line.encode('utf-8'))
+            line_sets[index] = lines
+            lsh.insert(index, signature)
 
-                    except (OSError, UnicodeDecodeError):
-                        continue
+            # Only earlier files are indexed yet, so each pair is seen once
+            for other in lsh.query(signature):
+                if other == index:
+                    continue
+                similarity = self.calculate_similarity(lines, line_sets[other])
+                if similarity >= threshold:
+                    self.similar_configs.append((paths[other], path, similarity))
 
     def find_duplicate_project_folders(self) -> List[Tuple[Path, str]]:
         """Find folders in home directory that might be duplicates of project folders."""
-        project_folder_names = {
-            p.name.lower() for p in self.project_dir.iterdir()
-            if p.is_dir() and not p.name.startswith('.')
-        }
+        with os.scandir(self.project_dir) as it:
+            project_folder_names = {
+                entry.name.lower() for entry in it
+                if entry.is_dir() and not entry.name.startswith('.')
+            }
 
         duplicates = []
 
         # Check top-level folders in home directory
-        for item in self.home_dir.iterdir():
-            if not item.is_dir() or item == self.project_dir:
+        with os.scandir(self.home_dir) as it:
+            home_dirs = [Path(entry.path) for entry in it if entry.is_dir()]
+
+        for item in home_dirs:
+            if item == self.project_dir:
                 continue
 
             if item.name.startswith('.'):
@@ -210,7 +490,7 @@ class DuplicateFinder:
         """Generate detailed report of findings."""
         report = {
             "summary": {
-                "total_files_scanned": len(self.file_hashes),
+                "total_files_scanned": sum(len(paths) for paths in self.file_sizes.values()),
                 "exact_duplicates_found": sum(1 for paths in self.file_hashes.values() if len(paths) > 1),
                 "ai_config_files_found": sum(len(paths) for paths in self.ai_configs.values()),
                 "similar_ai_configs": len(self.similar_configs)
@@ -230,7 +510,7 @@ class DuplicateFinder:
             if home_paths or project_paths:
                 report["exact_duplicates"].append({
                     "hash": file_hash[:16],
-                    "size_bytes": paths[0].stat().st_size if paths[0].exists() else 0,
+                    "size_bytes": self.hash_sizes.get(file_hash, 0),
                     "locations": [str(p) for p in paths],
                     "in_home": home_paths,
                     "in_project": project_paths
@@ -271,8 +551,7 @@ class DuplicateFinder:
             )
 
         # Write report
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2)
+        output_file.write_bytes(_dump_json(report))
 
         # Also create human-readable version
         self.generate_markdown_report(report, output_file.with_suffix('.md'))
@@ -282,7 +561,7 @@ class DuplicateFinder:
     def get_folder_size(self, folder: Path) -> float:
         """Get folder size in MB."""
         try:
-            total = sum(f.stat().st_size for f in folder.rglob('*') if f.is_file())
+            total = sum(entry.stat().st_size for entry in _scandir_recursive(folder))
             return round(total / (1024 * 1024), 2)
         except (OSError, PermissionError):
             return 0.0
@@ -353,6 +632,12 @@ class DuplicateFinder:
 
 def main():
     """Main entry point."""
+    ap = argparse.ArgumentParser(description=__doc__)
+    ap.add_argument(
+        "--no-cache", action="store_true", help="Recompute every hash from scratch"
+    )
+    args = ap.parse_args()
+
     home_dir = Path(r"C:\Users\Richard Wilks")
     project_dir = Path(r"C:\Users\Richard Wilks\CLI_RESTART")
 
@@ -363,11 +648,15 @@ def main():
     print(f"Project directory: {project_dir}")
     print()
 
-    finder = DuplicateFinder(home_dir, project_dir)
+    finder = DuplicateFinder(
+        home_dir, project_dir, cache_file=None if args.no_cache else HASH_CACHE_FILE
+    )
 
     # Scan both directories
     finder.scan_directory(project_dir, is_project=True)
     finder.scan_directory(home_dir, is_project=False)
+    finder._hash_size_collisions()
+    finder.save_hash_cache()
 
     # Find similar AI configs
     finder.find_similar_ai_configs(threshold=0.7)
@@ -100,7 +100,9 @@ def merge_settings(src: dict, dst: dict) -> dict:
 
 def copy_mode(src_path: Path, dst_path: Path):
     dst_path.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src_path, dst_path)
+    # Config files don't need their source mtime/permissions carried over;
+    # copyfile lets the kernel move the bytes (sendfile/fcopyfile).
+    shutil.copyfile(src_path, dst_path)
 
 
 def main():
@@ -1,12 +1,28 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Callable
 
 
-def run_parallel(tasks: Iterable[Callable[[], Any]], *, workers: int = 4) -> list[Any]:
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = [pool.submit(t) for t in tasks]
-        return [f.result() for f in as_completed(futures)]
+def _call(task: Callable[[], Any]) -> Any:
+    return task()
 
+
+def run_parallel(
+    tasks: Iterable[Callable[[], Any]],
+    *,
+    workers: int = 4,
+    use_process_pool: bool = False,
+) -> list[Any]:
+    """Run zero-argument callables concurrently; results keep task order.
+
+    ``use_process_pool`` sidesteps the GIL for CPU-bound work, but then the
+    tasks must be picklable (module-level functions or ``functools.partial``).
+    """
+    tasks = list(tasks)
+    executor = ProcessPoolExecutor if use_process_pool else ThreadPoolExecutor
+    with executor(max_workers=workers) as pool:
+        # chunksize only matters for process pools; threads ignore it
+        chunksize = max(1, len(tasks) // (workers * 4))
+        return list(pool.map(_call, tasks, chunksize=chunksize))
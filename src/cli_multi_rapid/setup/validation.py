@@ -8,6 +8,7 @@ Validates installation, dependencies, configuration, and provides quick-start se
 import json
 import subprocess
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Optional
 
@@ -155,15 +156,8 @@ class SystemValidator:
             "requests",
         ]
 
-        missing_packages = []
-        for package in required_packages:
-            try:
-                if package == "yaml":
-                    import yaml
-                else:
-                    __import__(package)
-            except ImportError:
-                missing_packages.append(package)
+        # find_spec answers "is it installed?" without executing the package
+        missing_packages = [pkg for pkg in required_packages if find_spec(pkg) is None]
 
         if missing_packages:
             self.issues.append(f"❌ Missing packages: {', '.join(missing_packages)}")
@@ -1,30 +1,27 @@
 from __future__ import annotations
 
+import functools
+import sys
 from dataclasses import dataclass
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Any
 
 
+@functools.cache
 def _import_integration_manager():
+    # Expect repo root on sys.path for src imports; only fall back to adding
+    # it when the package can't be located, and resolve the class once.
+    if find_spec("integrations") is None:
+        root = Path(__file__).resolve().parents[4] / "src"
+        if str(root) not in sys.path:
+            sys.path.append(str(root))
     try:
-        # Expect repo root on sys.path for src imports
         from integrations.integration_manager import IntegrationManager  # type: ignore
 
         return IntegrationManager
     except Exception:
-        try:
-            import sys
-            from pathlib import Path
-
-            root = Path(__file__).resolve().parents[4] / "src"
-            if str(root) not in sys.path:
-                sys.path.append(str(root))
-            from integrations.integration_manager import (
-                IntegrationManager,  # type: ignore
-            )
-
-            return IntegrationManager
-        except Exception:
-            return None
+        return None
 
 
 @dataclass
@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import tempfile
 from pathlib import Path
 
@@ -34,3 +35,43 @@ def test_backup_and_restore_sqlite() -> None:
         fetched = get_workstream(ws.id)
         assert fetched is not None and fetched.name == "to-backup"
 
+
+def test_backup_and_restore_sqlite_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    with sqlite3.connect("plain.db") as conn:
+        conn.execute("CREATE TABLE t (v TEXT)")
+        conn.execute("INSERT INTO t VALUES ('kept')")
+    conn.close()
+
+    backup_file = backup_database("sqlite:///plain.db", "backups")
+    Path("plain.db").unlink()
+    restore_database("sqlite:///plain.db", str(backup_file))
+
+    conn = sqlite3.connect("plain.db")
+    try:
+        assert conn.execute("SELECT v FROM t").fetchall() == [("kept",)]
+    finally:
+        conn.close()
+
+
+def test_backup_skips_unchanged_sqlite_file(tmp_path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    conn = sqlite3.connect("plain.db")
+    conn.execute("CREATE TABLE t (v TEXT)")
+    conn.commit()
+
+    first = backup_database("sqlite:///plain.db", "backups")
+    stamp = first.stat().st_mtime_ns
+    assert backup_database("sqlite:///plain.db", "backups").stat().st_mtime_ns == stamp
+    forced = backup_database("sqlite:///plain.db", "backups", force=True)
+    assert forced.stat().st_mtime_ns > stamp
+
+    conn.execute("INSERT INTO t VALUES ('new')")
+    conn.commit()
+    conn.close()
+    refreshed = backup_database("sqlite:///plain.db", "backups")
+    check = sqlite3.connect(refreshed)
+    try:
+        assert check.execute("SELECT v FROM t").fetchall() == [("new",)]
+    finally:
+        check.close()
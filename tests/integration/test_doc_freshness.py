@@ -0,0 +1,50 @@
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from scripts.check_doc_freshness import check_doc_freshness, get_last_commit_dates
+
+
+def _commit(repo: Path, path: str, timestamp: int) -> None:
+    (repo / path).parent.mkdir(parents=True, exist_ok=True)
+    (repo / path).write_text(f"{path} @ {timestamp}\n")
+    env = {
+        **os.environ,
+        "GIT_AUTHOR_DATE": f"{timestamp} +0000",
+        "GIT_COMMITTER_DATE": f"{timestamp} +0000",
+    }
+    git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+    subprocess.run([*git, "add", path], cwd=repo, env=env, check=True)
+    subprocess.run([*git, "commit", "-q", "-m", path], cwd=repo, env=env, check=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch) -> Path:
+    subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+    _commit(tmp_path, "docs/mod.md", 1_700_000_000)
+    _commit(tmp_path, "src/pkg/mod.py", 1_700_000_100)
+    _commit(tmp_path, "docs/other.md", 1_700_000_200)
+    _commit(tmp_path, "src/other.py", 1_700_000_150)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_get_last_commit_dates_parses_single_log(repo: Path) -> None:
+    assert get_last_commit_dates("src", "docs") == {
+        os.path.normpath("docs/mod.md"): 1_700_000_000,
+        os.path.normpath("src/pkg/mod.py"): 1_700_000_100,
+        os.path.normpath("docs/other.md"): 1_700_000_200,
+        os.path.normpath("src/other.py"): 1_700_000_150,
+    }
+
+
+def test_source_newer_than_doc_is_stale(repo: Path, capsys) -> None:
+    with pytest.raises(SystemExit) as exc:
+        check_doc_freshness()
+
+    assert exc.value.code == 1
+    out = capsys.readouterr().out
+    assert os.path.join("src", "pkg", "mod.py") in out
+    assert "other.py" not in out
@@ -0,0 +1,324 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import scripts.find_duplicates_advanced as fda
+from scripts.find_duplicates_advanced import DuplicateFinder
+
+
+def _scan(finder: DuplicateFinder, root: Path) -> None:
+    finder.scan_directory(root)
+    finder._hash_size_collisions()
+
+
+def test_only_size_collisions_are_hashed(tmp_path: Path, monkeypatch) -> None:
+    (tmp_path / "a.txt").write_text("same")
+    (tmp_path / "b.txt").write_text("same")
+    (tmp_path / "c.txt").write_text("diff")
+    (tmp_path / "unique.txt").write_text("longer content")
+
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    finder.scan_directory(tmp_path)
+    assert sorted(p.name for p in finder.file_sizes[4]) == ["a.txt", "b.txt", "c.txt"]
+
+    hashed = []
+    real_get_file_hash = finder.get_file_hash
+
+    def spy(path):
+        hashed.append(path.name)
+        return real_get_file_hash(path)
+
+    monkeypatch.setattr(finder, "get_file_hash", spy)
+    finder._hash_size_collisions()
+
+    assert "unique.txt" not in hashed
+    dupes = finder.find_exact_duplicates()
+    assert [sorted(p.name for p in ps) for ps in dupes.values()] == [["a.txt", "b.txt"]]
+
+
+def test_hash_cache_reused_until_file_changes(tmp_path: Path) -> None:
+    data = tmp_path / "data"
+    data.mkdir()
+    (data / "a.txt").write_text("same")
+    (data / "b.txt").write_text("same")
+    cache_file = tmp_path / "cache" / "hashes.sqlite"
+
+    first = DuplicateFinder(data, data, cache_file=cache_file)
+    _scan(first, data)
+    first.save_hash_cache()
+
+    second = DuplicateFinder(data, data, cache_file=cache_file)
+    key = str(data / "a.txt")
+    size, mtime_ns, _ = second.hash_cache[key]
+    second.hash_cache[key] = (size, mtime_ns, "cached")
+    assert second.get_file_hash(data / "a.txt") == "cached"
+
+    second.hash_cache[key] = (size, mtime_ns - 1, "stale")
+    assert second.get_file_hash(data / "a.txt") == first.get_file_hash(data / "a.txt")
+
+
+def test_hash_cache_drops_deleted_files(tmp_path: Path) -> None:
+    data = tmp_path / "data"
+    data.mkdir()
+    for name in ("a.txt", "b.txt", "c.txt"):
+        (data / name).write_text("same")
+    cache_file = tmp_path / "cache" / "hashes.sqlite"
+
+    first = DuplicateFinder(data, data, cache_file=cache_file)
+    _scan(first, data)
+    first.save_hash_cache()
+
+    (data / "c.txt").unlink()
+    second = DuplicateFinder(data, data, cache_file=cache_file)
+    _scan(second, data)
+    second.save_hash_cache()
+
+    third = DuplicateFinder(data, data, cache_file=cache_file)
+    assert sorted(third.hash_cache) == [str(data / "a.txt"), str(data / "b.txt")]
+
+
+def test_fingerprint_mismatch_skips_full_hash(tmp_path: Path) -> None:
+    (tmp_path / "a.dat").write_bytes(b"x" * 10000 + b"a")
+    (tmp_path / "b.dat").write_bytes(b"x" * 10000 + b"b")
+    (tmp_path / "c.dat").write_bytes(b"x" * 10000 + b"a")
+
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    _scan(finder, tmp_path)
+
+    hashed = [p.name for ps in finder.file_hashes.values() for p in ps]
+    assert sorted(hashed) == ["a.dat", "c.dat"]
+
+
+def test_mmap_digest_matches_streamed_digest(tmp_path: Path, monkeypatch) -> None:
+    path = tmp_path / "large.dat"
+    path.write_bytes(bytes(range(256)) * 4096)
+    hasher = fda._new_hasher()
+    hasher.update(path.read_bytes())
+    expected = hasher.hexdigest()
+
+    mapped = []
+    real_mmap_digest = fda._mmap_digest
+
+    def spy(f):
+        mapped.append(f.name)
+        return real_mmap_digest(f)
+
+    monkeypatch.setattr(fda, "MMAP_THRESHOLD", 1024)
+    monkeypatch.setattr(fda, "_mmap_digest", spy)
+    finder = DuplicateFinder(tmp_path, tmp_path)
+
+    assert finder.get_file_hash(path) == expected
+    assert mapped == [str(path)]
+
+
+def test_scandir_walk_finds_nested_files_and_sizes(tmp_path: Path) -> None:
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "top.txt").write_bytes(b"x" * 1024 * 1024)
+    (tmp_path / "a" / "b" / "deep.txt").write_bytes(b"y" * 512 * 1024)
+
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    finder.scan_directory(tmp_path)
+
+    assert finder.file_sizes == {
+        1024 * 1024: [tmp_path / "top.txt"],
+        512 * 1024: [tmp_path / "a" / "b" / "deep.txt"],
+    }
+    assert finder.get_folder_size(tmp_path) == 1.5
+
+
+def test_skip_dirs_pruned_case_insensitively(tmp_path: Path, monkeypatch) -> None:
+    for skipped in ("Node_Modules", "appdata", ".git"):
+        (tmp_path / skipped / "nested").mkdir(parents=True)
+        (tmp_path / skipped / "nested" / "a.txt").write_text("same")
+    (tmp_path / "kept").mkdir()
+    (tmp_path / "kept" / "a.txt").write_text("same")
+
+    scanned = []
+    real_scandir = fda.os.scandir
+
+    def spy(path):
+        scanned.append(Path(path).name)
+        return real_scandir(path)
+
+    monkeypatch.setattr(fda.os, "scandir", spy)
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    finder.scan_directory(tmp_path)
+
+    assert sorted(scanned) == sorted([tmp_path.name, "kept"])
+    assert finder.file_sizes == {4: [tmp_path / "kept" / "a.txt"]}
+
+
+def test_report_uses_sizes_recorded_during_scan(tmp_path: Path) -> None:
+    home, project = tmp_path / "home", tmp_path / "project"
+    (project / "docs").mkdir(parents=True)
+    (home / "docs").mkdir(parents=True)
+    (project / "docs" / "a.txt").write_text("same")
+    (home / "docs" / "a.txt").write_text("same")
+
+    finder = DuplicateFinder(home, project)
+    finder.scan_directory(project, is_project=True)
+    finder.scan_directory(home)
+    finder._hash_size_collisions()
+    # The report must not stat the files again
+    (project / "docs" / "a.txt").unlink()
+
+    report = finder.generate_report(tmp_path / "report.json")
+
+    assert [d["size_bytes"] for d in report["exact_duplicates"]] == [4]
+    assert report["duplicate_project_folders"] == [
+        {
+            "path": str(home / "docs"),
+            "reason": "Matches project folder: docs",
+            "size_mb": 0.0,
+        }
+    ]
+
+
+def test_threaded_hashing_keeps_scan_order(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(fda, "HASH_WORKERS", 4)
+    for i in range(40):
+        (tmp_path / f"f{i:02d}.txt").write_text(f"group{i % 2}")
+
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    _scan(finder, tmp_path)
+
+    scanned = finder.file_sizes[6]
+    expected = {}
+    for path in scanned:
+        expected.setdefault(finder._compute_file_hash(path), []).append(path)
+    assert finder.file_hashes == expected
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        (".aider.conf.yml", True),
+        (".CLAUDE.md", True),
+        (".cursorrules", True),
+        (".env.local", True),
+        ("Ollama-config.json", True),
+        ("deepseek_config", True),
+        ("my.env", False),
+        ("config.yaml", False),
+    ],
+)
+def test_is_ai_config_file(tmp_path: Path, name: str, expected: bool) -> None:
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    assert finder.is_ai_config_file(Path(name)) is expected
+
+
+def _write_configs(root: Path, count: int) -> None:
+    for i in range(count):
+        (root / f"d{i}").mkdir()
+        # Near-identical configs, except every fifth one is unrelated
+        prefix = f"other{i}_" if i % 5 == 0 else "key"
+        body = "\n".join(f"{prefix}{n}: {n}" for n in range(20))
+        (root / f"d{i}" / ".aider.conf").write_text(f"{body}\nfamily: {i % 3}\n")
+
+
+def _similar_pairs(finder: DuplicateFinder) -> set:
+    return {
+        (frozenset((a.parent.name, b.parent.name)), round(score, 6))
+        for a, b, score in finder.similar_configs
+    }
+
+
+def test_minhash_lsh_matches_pairwise(tmp_path: Path, monkeypatch) -> None:
+    pytest.importorskip("datasketch")
+    _write_configs(tmp_path, fda.LSH_MIN_GROUP + 5)
+
+    lsh_finder = DuplicateFinder(tmp_path, tmp_path)
+    lsh_finder.scan_directory(tmp_path)
+    used_lsh = []
+    real_lsh = lsh_finder._find_similar_with_lsh
+
+    def spy(paths, threshold):
+        used_lsh.append(len(paths))
+        return real_lsh(paths, threshold)
+
+    monkeypatch.setattr(lsh_finder, "_find_similar_with_lsh", spy)
+    lsh_finder.find_similar_ai_configs(threshold=0.7)
+
+    monkeypatch.setattr(fda, "MinHashLSH", None)
+    pairwise_finder = DuplicateFinder(tmp_path, tmp_path)
+    pairwise_finder.scan_directory(tmp_path)
+    pairwise_finder.find_similar_ai_configs(threshold=0.7)
+
+    assert used_lsh == [fda.LSH_MIN_GROUP + 5]
+    assert _similar_pairs(lsh_finder) == _similar_pairs(pairwise_finder)
+    # 20 related configs pair up with each other; the 5 unrelated ones do not
+    assert len(pairwise_finder.similar_configs) == 20 * 19 // 2
+
+
+def test_pairwise_similarity_reads_each_config_once(
+    tmp_path: Path, monkeypatch
+) -> None:
+    _write_configs(tmp_path, 4)
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    finder.scan_directory(tmp_path)
+
+    loaded = []
+    real_load = finder.load_config_lines
+
+    def spy(path):
+        loaded.append(path.parent.name)
+        return real_load(path)
+
+    monkeypatch.setattr(finder, "load_config_lines", spy)
+    finder.find_similar_ai_configs(threshold=0.7)
+
+    assert sorted(loaded) == ["d0", "d1", "d2", "d3"]
+    assert len(finder.similar_configs) == 3  # d0 is unrelated to the rest
+
+
+def test_calculate_similarity_on_line_sets(tmp_path: Path) -> None:
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    assert finder.calculate_similarity({"a", "b", "c"}, {"a", "b", "d"}) == 0.5
+    assert finder.calculate_similarity(set(), {"a"}) == 0.0
+
+
+def test_normalize_config_content(tmp_path: Path) -> None:
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    content = "# header\r\nkey: 1  # note\r\n   \r\n  nested: 2   \n\n# end"
+    assert finder.normalize_config_content(content) == "key: 1\n  nested: 2"
+
+
+def test_report_json_round_trips(tmp_path: Path) -> None:
+    home, project = tmp_path / "home", tmp_path / "project"
+    home.mkdir()
+    project.mkdir()
+    (home / "ünïcode.txt").write_text("same")
+    (project / "ünïcode.txt").write_text("same")
+    finder = DuplicateFinder(home, project)
+    finder.scan_directory(project, is_project=True)
+    finder.scan_directory(home)
+    finder._hash_size_collisions()
+
+    output = tmp_path / "report.json"
+    report = finder.generate_report(output)
+
+    assert json.loads(output.read_bytes()) == report
+    assert output.read_text(encoding="utf-8").startswith('{\n  "summary": {')
+    assert output.with_suffix(".md").exists()
+
+
+def test_scan_hashes_large_kept_files_via_mmap(tmp_path: Path, monkeypatch) -> None:
+    assert fda.MMAP_THRESHOLD < fda.MAX_FILE_SIZE
+    payload = b"z" * (fda.MMAP_THRESHOLD + 1)
+    (tmp_path / "a.dat").write_bytes(payload)
+    (tmp_path / "b.dat").write_bytes(payload)
+
+    mapped = []
+    real_mmap_digest = fda._mmap_digest
+
+    def spy(f):
+        mapped.append(Path(f.name).name)
+        return real_mmap_digest(f)
+
+    monkeypatch.setattr(fda, "_mmap_digest", spy)
+    finder = DuplicateFinder(tmp_path, tmp_path)
+    _scan(finder, tmp_path)
+
+    assert sorted(mapped) == ["a.dat", "b.dat"]
+    assert len(finder.find_exact_duplicates()) == 1
@@ -1,3 +1,5 @@
+from functools import partial
+
 from scripts.parallel_dispatch import run_parallel
 
 
@@ -9,3 +11,12 @@ def test_parallel_runs() -> None:
     results = run_parallel(tasks, workers=3)
     assert sorted(results) == [0, 1, 4, 9, 16]
 
+
+def test_parallel_preserves_task_order() -> None:
+    tasks = [lambda n=n: n for n in range(20)]
+    assert run_parallel(tasks, workers=4) == list(range(20))
+
+
+def test_parallel_process_pool() -> None:
+    tasks = [partial(pow, n, 2) for n in range(5)]
+    assert run_parallel(tasks, workers=2, use_process_pool=True) == [0, 1, 4, 9, 16]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import json
+import subprocess
+from pathlib import Path
+
+from scripts.check_schema_compatibility import _git_show_many
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_git_show_many_reads_present_and_missing(tmp_path, monkeypatch) -> None:
+    schemas = tmp_path / ".ai" / "schemas"
+    schemas.mkdir(parents=True)
+    base = {"$schema": "x", "version": "1.0.0", "required": ["a"]}
+    # Leading BOM and a trailing newline exercise the size-based parsing
+    payload = b"\xef\xbb\xbf" + json.dumps(base).encode() + b"\n"
+    (schemas / "present.json").write_bytes(payload)
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "base")
+    _git(tmp_path, "tag", "base")
+    (schemas / "added.json").write_text("{}")
+
+    monkeypatch.chdir(tmp_path)
+    paths = [".ai/schemas/added.json", ".ai/schemas/present.json"]
+    result = _git_show_many(paths, "base")
+
+    assert result == {paths[0]: None, paths[1]: base}
+
+
+def test_git_show_many_without_paths_runs_nothing() -> None:
+    assert _git_show_many([], "base") == {}
@@ -0,0 +1,79 @@
+"""Tests for the quarantined workflow schema validator."""
+
+import importlib
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = (
+    Path(__file__).resolve().parents[2] / ".quarantine" / "candidates" / "scripts"
+)
+
+
+@pytest.fixture
+def validate_schemas(tmp_path, monkeypatch):
+    monkeypatch.syspath_prepend(str(SCRIPTS_DIR))
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / ".ai" / "schemas").mkdir(parents=True)
+    (tmp_path / ".ai" / "workflows").mkdir(parents=True)
+    return importlib.import_module("validate_schemas")
+
+
+def _write_repo(root: Path, schema: dict, workflows: int) -> None:
+    (root / ".ai" / "schemas" / "workflow.schema.json").write_text(json.dumps(schema))
+    for i in range(workflows):
+        (root / ".ai" / "workflows" / f"wf{i}.yaml").write_text("name: example\n")
+
+
+@pytest.mark.parametrize("workflows", [2, 10])
+def test_invalid_schema_reported_on_serial_and_pool_paths(
+    validate_schemas, tmp_path, capsys, workflows
+):
+    assert (workflows >= validate_schemas.PARALLEL_THRESHOLD) == (workflows == 10)
+    _write_repo(tmp_path, {"type": 12}, workflows)
+
+    assert validate_schemas.validate_workflows() == 1
+    err = capsys.readouterr().err
+    assert err.count("FAIL") == 1
+    assert "invalid schema" in err
+
+
+@pytest.mark.parametrize("workflows", [2, 10])
+def test_workflow_errors_counted_on_serial_and_pool_paths(
+    validate_schemas, tmp_path, workflows
+):
+    schema = {"type": "object", "required": ["steps"]}
+    _write_repo(tmp_path, schema, workflows)
+
+    assert validate_schemas.validate_workflows(max_workers=2) == workflows
+
+
+@pytest.mark.parametrize("workflows", [2, 10])
+def test_unresolvable_ref_fails_each_workflow(
+    validate_schemas, tmp_path, capsys, workflows
+):
+    _write_repo(tmp_path, {"$ref": "#/definitions/missing"}, workflows)
+
+    assert validate_schemas.validate_workflows(max_workers=2) == workflows
+    fail_lines = capsys.readouterr().err.strip().splitlines()
+    assert len(fail_lines) == workflows
+    assert all(line.startswith("FAIL ") for line in fail_lines)
+    assert all("missing" in line for line in fail_lines)
+
+
+@pytest.mark.parametrize("ignore_case", [False, True])
+def test_find_files_case_matches_platform_glob(
+    validate_schemas, tmp_path, monkeypatch, ignore_case
+):
+    workflows = tmp_path / ".ai" / "workflows"
+    (workflows / "lower.yaml").write_text("name: a\n")
+    (workflows / "Deploy.YAML").write_text("name: b\n")
+    flags = re.IGNORECASE if ignore_case else 0
+    monkeypatch.setattr(validate_schemas, "_NAME_FLAGS", flags)
+
+    found = validate_schemas.find_files([".ai/workflows/*.yaml"])
+
+    expected = ["Deploy.YAML", "lower.yaml"] if ignore_case else ["lower.yaml"]
+    assert sorted(p.name for p in found) == expected